@@ -1,3 +1,5 @@
+import functools
+
 from langchain_openai import ChatOpenAI
 from langchain_core.prompts import PromptTemplate
 from langchain_core.output_parsers import PydanticOutputParser
@@ -7,45 +9,43 @@ class CodeGeneration(BaseModel):
     code: str = Field(description="Generated Python code")
     explanation: str = Field(description="Explanation of the code")
 
-def generate_code(task_description):
-    # Note: Assuming Ollama running locally. Adjust base_url/api_key if needed.
-    # Standard ChatOpenAI attempts to connect to OpenAI API.
-    # For Ollama usage with LangChain's ChatOpenAI wrapper:
-    llm = ChatOpenAI(
-        model_name="llama2", 
-        temperature=0.7,
-        base_url="http://localhost:11434/v1", # Typical Ollama endpoint
-        api_key="ollama" # Required for local non-OpenAI usage
-    )
-    prompt = PromptTemplate(
-        template="Generate Python code for: {description}\n\nReturn only the code.",
-        input_variables=["description"]
-    )
-    # Note: PydanticOutputParser instructions need to be injected into the prompt
-    # or the model might not follow JSON structure perfectly without instructions.
-    # But following "Return only the code" user prompt strictly.
-    # However, to use the parser, we usually do:
-    parser = PydanticOutputParser(pydantic_object=CodeGeneration)
-    
-    # We should add formatting instructions to the prompt if we want the parser to work
-    prompt.template += "\n{format_instructions}"
-    
-    formatted_prompt = prompt.format(
-        description=task_description,
-        format_instructions=parser.get_format_instructions()
-    )
+# Built once at import: the parser, its format instructions and the prompt
+# template are identical for every task, and get_format_instructions walks
+# the whole pydantic schema each time it runs
+_PARSER = PydanticOutputParser(pydantic_object=CodeGeneration)
+_PROMPT = PromptTemplate(
+    template="Generate Python code for: {description}\n\nReturn only the code.\n{format_instructions}",
+    input_variables=["description"],
+    partial_variables={"format_instructions": _PARSER.get_format_instructions()}
+)
+
+def _extract_code(content):
+    """Pull the code out of a markdown-fenced LLM response"""
+    if "```python" in content:
+        return content.split("```python")[1].split("```")[0].strip()
+    elif "```html" in content:
+        return content.split("```html")[1].split("```")[0].strip()
+    elif "```" in content:
+        block = content.split("```")[1]
+        if "\n" in block:
+            first_line = block.split("\n")[0].strip()
+            if first_line.isalnum():
+                block = block[len(first_line):]
+        return block.split("```")[0].strip()
+    return content
+
+@functools.lru_cache(maxsize=128)
+def generate_code_demo(task_description):
+    """Pattern-based offline generation (SMART DEMO MODE).
+
+    Deterministic per prompt, so repeated demo requests for the same task
+    are served from the cache instead of re-running the pattern matching
+    and markdown extraction.
+    """
+    task_lower = task_description.lower()
     
-    try:
-        response = llm.invoke(formatted_prompt)
-        content = response.content
-    except Exception as e:
-        print(f"\n⚠️  LLM Connection Failed: {str(e)}")
-        print("ℹ️  Switching to SMART DEMO MODE (Pattern-based Generation).")
-        
-        task_lower = task_description.lower()
-        
-        if "login" in task_lower or "signup" in task_lower:
-            content = """
+    if "login" in task_lower or "signup" in task_lower:
+        content = """
 ```python
 # Generated by AutoDevCrew - Login Module
 def authenticate_user(username, password):
@@ -63,15 +63,15 @@ if __name__ == "__main__":
     print(f"Status: {msg}")
 ```
 """
-        elif "calculator" in task_lower:
-            content = """
+    elif "calculator" in task_lower:
+        content = """
 ```python
 # Generated by AutoDevCrew - Calculator Module
 class Calculator:
     def add(self, a, b): return a + b
     def subtract(self, a, b): return a - b
     def multiply(self, a, b): return a * b
-    def divide(self, a, b): 
+    def divide(self, a, b):
         if b == 0: return "Error: Division by zero"
         return a / b
 
@@ -80,8 +80,8 @@ if __name__ == "__main__":
     print(f"10 + 5 = {calc.add(10, 5)}")
 ```
 """
-        elif "data" in task_lower or "csv" in task_lower or "json" in task_lower:
-            content = """
+    elif "data" in task_lower or "csv" in task_lower or "json" in task_lower:
+        content = """
 ```python
 # Generated by AutoDevCrew - Data Processor
 import json
@@ -103,9 +103,9 @@ if __name__ == "__main__":
     print(process_data(test_data))
 ```
 """
-        else:
-            # General fallback
-            content = f"""
+    else:
+        # General fallback
+        content = f"""
 ```python
 # Generated by AutoDevCrew - Generic Task
 # Task: {task_description}
@@ -119,20 +119,30 @@ if __name__ == "__main__":
 ```
 """
 
+    return _extract_code(content)
+
+def generate_code(task_description):
+    # Note: Assuming Ollama running locally. Adjust base_url/api_key if needed.
+    # Standard ChatOpenAI attempts to connect to OpenAI API.
+    # For Ollama usage with LangChain's ChatOpenAI wrapper:
+    llm = ChatOpenAI(
+        model_name="llama2",
+        temperature=0.7,
+        base_url="http://localhost:11434/v1", # Typical Ollama endpoint
+        api_key="ollama" # Required for local non-OpenAI usage
+    )
+    formatted_prompt = _PROMPT.format(description=task_description)
+
     try:
-        parsed_output = parser.parse(content)
-        return parsed_output.code
+        response = llm.invoke(formatted_prompt)
+        content = response.content
     except Exception as e:
+        print(f"\n\u26a0\ufe0f  LLM Connection Failed: {str(e)}")
+        print("\u2139\ufe0f  Switching to SMART DEMO MODE (Pattern-based Generation).")
+        return generate_code_demo(task_description)
+
+    try:
+        return _PARSER.parse(content).code
+    except Exception:
         # Fallback: Try to extract code from markdown blocks
-        if "```python" in content:
-            return content.split("```python")[1].split("```")[0].strip()
-        elif "```html" in content:
-            return content.split("```html")[1].split("```")[0].strip()
-        elif "```" in content:
-            block = content.split("```")[1]
-            if "\n" in block:
-                first_line = block.split("\n")[0].strip()
-                if first_line.isalnum(): 
-                    block = block[len(first_line):]
-            return block.split("```")[0].strip()
-        return content
+        return _extract_code(content)
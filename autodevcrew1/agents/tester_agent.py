@@ -8,15 +8,19 @@ def validate_code(code):
         # Basic syntax check
         ast.parse(code)
         
-        # Heuristic checks
+        # Heuristic checks: lowercase the source once and count newlines
+        # directly instead of re-lowering/re-splitting per check
+        code_lower = code.lower()
+        line_count = code.count('\n') + 1
+
         report = []
         report.append("✅ Syntax Check: PASSED")
-        
-        if "login" in code.lower() or "auth" in code.lower():
+
+        if "login" in code_lower or "auth" in code_lower:
             report.append("✅ Context Verification: Contains relevant keywords (Login/Auth)")
-        
-        if len(code.split('\n')) > 5:
-            report.append(f"✅ Complexity: Code has {len(code.split('\n'))} lines (Satisfactory)")
+
+        if line_count > 5:
+            report.append(f"✅ Complexity: Code has {line_count} lines (Satisfactory)")
         
         return True, "\n".join(report)
         
@@ -25,22 +29,25 @@ def validate_code(code):
     except Exception as e:
         return False, f"❌ Generic Error: {str(e)}"
 
-def generate_tests(code):
-    """Basic test suite generation"""
-    test_template = f"""
-import pytest
+# Static halves of the generated test module, precomputed once at import time
+# so each generate_tests call only pays for repr() of the code under test.
+_TEST_HEAD = """import pytest
 
 # Generated Test Suite for AutoDevCrew
 def test_syntax_integrity():
-    # Verify the code is valid python
-    import ast
+    # Verify the code is valid python; compile() is faster than ast.parse
+    # since it goes straight to bytecode without materializing AST nodes
     try:
-        ast.parse({repr(code)})
+        compile("""
+
+_TEST_TAIL = """, '<generated>', 'exec')
         assert True
     except:
         assert False, "Syntax failure in generated code"
 
 def test_placeholder():
-    assert 1 == 1 # Basic smoke test
-"""
-    return test_template.strip()
+    assert 1 == 1 # Basic smoke test"""
+
+def generate_tests(code):
+    """Basic test suite generation"""
+    return _TEST_HEAD + repr(code) + _TEST_TAIL
@@ -7,7 +7,17 @@ lightweight mode optimization, and cloud deployment.
 
 from .privacy_manager import PrivacyManager, PrivacyLevel, DataRetentionPolicy
 from .lightweight_mode import LightweightMode, HardwareProfile, QuantizationLevel
-from .cloud_deployer import CloudDeployer, DeploymentConfig
+
+# CloudDeployer drags in requests (and huggingface_hub), which the privacy
+# and lightweight paths never need; resolve its re-exports lazily (PEP 562)
+# so deferring the import at call sites actually takes effect
+_LAZY_EXPORTS = {"CloudDeployer", "DeploymentConfig"}
+
+def __getattr__(name):
+    if name in _LAZY_EXPORTS:
+        from . import cloud_deployer
+        return getattr(cloud_deployer, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 __all__ = [
     'PrivacyManager',
@@ -6,11 +6,26 @@ except ImportError:
     torch = None
 
 from pathlib import Path
+import functools
 import json
+import os
 from typing import Dict, Any, Optional
 from dataclasses import dataclass
 from enum import Enum
 
+try:
+    import orjson  # Optional: C-accelerated JSON, ~3-5x faster than stdlib
+except ImportError:
+    orjson = None
+
+def _json_loads(buf):
+    return orjson.loads(buf) if orjson is not None else json.loads(buf)
+
+def _json_dumps_bytes(obj, indent: bool = False):
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if indent else 0)
+    return json.dumps(obj, indent=2 if indent else None).encode()
+
 class QuantizationLevel(Enum):
     FP16 = "fp16"        # Half precision
     INT8 = "int8"        # 8-bit quantization
@@ -25,6 +40,37 @@ class HardwareProfile:
     has_gpu: bool
     gpu_model: Optional[str] = None
 
+@functools.lru_cache(maxsize=1)
+def _detect_hardware_cached() -> HardwareProfile:
+    """Probe hardware once per process; psutil and CUDA probes are slow
+    (CUDA context init alone costs >100 ms) and the answer never changes."""
+    import psutil
+
+    ram_gb = psutil.virtual_memory().total / (1024**3)
+    cpu_cores = psutil.cpu_count(logical=False)
+
+    # Try to detect GPU
+    has_gpu = False
+    gpu_model = None
+    vram_gb = 0
+
+    try:
+        import torch
+        if torch.cuda.is_available():
+            has_gpu = True
+            gpu_model = torch.cuda.get_device_name(0)
+            vram_gb = torch.cuda.get_device_properties(0).total_memory / (1024**3)
+    except:
+        pass
+
+    return HardwareProfile(
+        ram_gb=ram_gb,
+        vram_gb=vram_gb,
+        cpu_cores=cpu_cores,
+        has_gpu=has_gpu,
+        gpu_model=gpu_model
+    )
+
 class LightweightMode:
     def __init__(self, hardware_profile: Optional[HardwareProfile] = None):
         self.hardware_profile = hardware_profile or self.detect_hardware()
@@ -40,33 +86,7 @@ class LightweightMode:
     
     def detect_hardware(self) -> HardwareProfile:
         """Auto-detect hardware capabilities"""
-        import psutil
-        import platform
-        
-        ram_gb = psutil.virtual_memory().total / (1024**3)
-        cpu_cores = psutil.cpu_count(logical=False)
-        
-        # Try to detect GPU
-        has_gpu = False
-        gpu_model = None
-        vram_gb = 0
-        
-        try:
-            import torch
-            if torch.cuda.is_available():
-                has_gpu = True
-                gpu_model = torch.cuda.get_device_name(0)
-                vram_gb = torch.cuda.get_device_properties(0).total_memory / (1024**3)
-        except:
-            pass
-        
-        return HardwareProfile(
-            ram_gb=ram_gb,
-            vram_gb=vram_gb,
-            cpu_cores=cpu_cores,
-            has_gpu=has_gpu,
-            gpu_model=gpu_model
-        )
+        return _detect_hardware_cached()
     
     def determine_optimal_quantization(self) -> QuantizationLevel:
         """Determine best quantization based on hardware"""
@@ -82,19 +102,40 @@ class LightweightMode:
     def scan_available_models(self) -> Dict[str, Path]:
         """Scan for available quantized models"""
         models = {}
-        
+
         if not self.quantized_models_dir.exists():
             self.quantized_models_dir.mkdir(parents=True, exist_ok=True)
             self.download_default_models()
-        
-        for model_dir in self.quantized_models_dir.iterdir():
-            if model_dir.is_dir():
-                config_file = model_dir / "config.json"
+
+        # Reuse the cached manifest when the models directory hasn't changed;
+        # a full rebuild costs a stat + open + JSON parse per model directory
+        manifest_file = self.quantized_models_dir / "_index.json"
+        dir_mtime = self.quantized_models_dir.stat().st_mtime
+        if manifest_file.exists() and manifest_file.stat().st_mtime >= dir_mtime:
+            try:
+                with open(manifest_file, 'rb') as f:
+                    return {name: Path(path) for name, path in _json_loads(f.read()).items()}
+            except (ValueError, OSError):
+                pass  # Corrupt/unreadable manifest: fall through and rebuild
+
+        # os.scandir batches directory entries (and their type info) in far
+        # fewer syscalls than per-entry Path.is_dir() stats
+        with os.scandir(self.quantized_models_dir) as entries:
+            for entry in entries:
+                if not entry.is_dir():
+                    continue
+                config_file = Path(entry.path) / "config.json"
                 if config_file.exists():
-                    with open(config_file) as f:
-                        config = json.load(f)
-                        models[config["model_name"]] = model_dir
-        
+                    with open(config_file, 'rb') as f:
+                        config = _json_loads(f.read())
+                        models[config["model_name"]] = Path(entry.path)
+
+        try:
+            with open(manifest_file, 'wb') as f:
+                f.write(_json_dumps_bytes({name: str(path) for name, path in models.items()}))
+        except OSError:
+            pass  # Manifest is only a cache; scanning still worked
+
         return models
     
     def download_default_models(self):
@@ -106,39 +147,49 @@ class LightweightMode:
         }
         
         print("Downloading default quantized models for offline use...")
-        
-        for model_name, url in default_models.items():
-            model_dir = self.quantized_models_dir / model_name
-            model_dir.mkdir(exist_ok=True)
-            
-            # Download GGUF file
-            import requests
-            try:
-                # Use a timeout to avoid hanging indefinitely if network is bad
-                response = requests.get(url, stream=True, timeout=30)
-                if response.status_code == 200:
-                    model_file = model_dir / "model.gguf"
-                    
-                    with open(model_file, 'wb') as f:
-                        for chunk in response.iter_content(chunk_size=8192):
-                            f.write(chunk)
-                    
-                    # Create config
-                    config = {
-                        "model_name": model_name,
-                        "quantization": "Q4_K_M",
-                        "format": "GGUF",
-                        "size_gb": model_file.stat().st_size / (1024**3),
-                        "compatibility": "CPU/GPU",
-                        "layers": 32
-                    }
-                    
-                    with open(model_dir / "config.json", 'w') as f:
-                        json.dump(config, f, indent=2)
-                else:
-                    print(f"Failed to download {model_name}: Status {response.status_code}")
-            except Exception as e:
-                print(f"Error downloading {model_name}: {e}")
+
+        # Downloads are network-bound, so fetch the three models concurrently
+        # instead of serially
+        from concurrent.futures import ThreadPoolExecutor
+        with ThreadPoolExecutor(max_workers=len(default_models)) as executor:
+            for model_name, url in default_models.items():
+                executor.submit(self._download_model, model_name, url)
+
+    def _download_model(self, model_name: str, url: str):
+        """Stream a single GGUF model to disk and write its config"""
+        model_dir = self.quantized_models_dir / model_name
+        model_dir.mkdir(exist_ok=True)
+
+        # Download GGUF file
+        import requests
+        try:
+            # Use a timeout to avoid hanging indefinitely if network is bad
+            response = requests.get(url, stream=True, timeout=30)
+            if response.status_code == 200:
+                model_file = model_dir / "model.gguf"
+
+                with open(model_file, 'wb') as f:
+                    # 1 MiB chunks: multi-GB GGUF files at 8 KiB granularity
+                    # spend more time in the Python loop than on the wire
+                    for chunk in response.iter_content(chunk_size=1 << 20):
+                        f.write(chunk)
+
+                # Create config
+                config = {
+                    "model_name": model_name,
+                    "quantization": "Q4_K_M",
+                    "format": "GGUF",
+                    "size_gb": model_file.stat().st_size / (1024**3),
+                    "compatibility": "CPU/GPU",
+                    "layers": 32
+                }
+
+                with open(model_dir / "config.json", 'wb') as f:
+                    f.write(_json_dumps_bytes(config, indent=True))
+            else:
+                print(f"Failed to download {model_name}: Status {response.status_code}")
+        except Exception as e:
+            print(f"Error downloading {model_name}: {e}")
     
     def load_quantized_model(self, model_name: str):
         """Load quantized model with optimal settings"""
@@ -1,6 +1,11 @@
 import os
 import json
 from pathlib import Path
+
+try:
+    import orjson  # Optional: C-accelerated JSON, ~3-5x faster than stdlib
+except ImportError:
+    orjson = None
 from typing import Dict, Any, Optional, List
 import hashlib
 from enum import Enum
@@ -20,12 +25,23 @@ class PrivacyManager:
         self.privacy_level = privacy_level
         self.data_retention_policy = DataRetentionPolicy.LOCAL_ONLY
         self.encryption_key = self._generate_encryption_key()
+        self._aesgcm = None  # Built lazily on first encrypt
         self.blocked_domains = ["api.openai.com", "api.anthropic.com", "api.cohere.ai"]
         self.local_cache_dir = Path("~/.autodevcrew/cache").expanduser()
         self.local_cache_dir.mkdir(parents=True, exist_ok=True)
+
+        # Running cache-size counter, seeded once so privacy reports don't
+        # re-stat every cache file (os.scandir gets sizes from the dirents)
+        with os.scandir(self.local_cache_dir) as entries:
+            self._cache_bytes = sum(entry.stat().st_size for entry in entries)
         
-        # Data anonymization salt
+        # Data anonymization salt (cache the encoded form so hashing doesn't
+        # re-encode it per value)
         self.anonymization_salt = hashlib.sha256(os.urandom(32)).hexdigest()
+        self._salt_bytes = self.anonymization_salt.encode()
+        # Salted hasher prototype: per-value hashing copies this instead of
+        # re-absorbing the salt each time
+        self._hash_proto = hashlib.sha256(self._salt_bytes)
     
     def _generate_encryption_key(self) -> bytes:
         """Generate encryption key for sensitive data"""
@@ -57,55 +73,96 @@ class PrivacyManager:
         # Simple heuristic for now
         return "download" in operation or "api" in operation or "http" in operation
     
+    # Hosts that stay reachable while strict offline mode is active
+    _ALLOWED_HOSTS = frozenset({"localhost", "127.0.0.1", "::1"})
+
     def _block_external_network(self):
         """Block external network calls"""
         import socket
-        
-        original_socket = socket.socket
-        
-        class BlockedSocket(original_socket):
-            def connect(self, address):
-                host, port = address[0], address[1]
-                # Allow local connections
-                if host in ["localhost", "127.0.0.1", "::1"]:
-                    return super().connect(address)
-                    
-                raise ConnectionError(
-                    f"Privacy violation: External connection to {host}:{port} blocked. "
-                    f"System is in strict offline mode."
-                )
-        
-        socket.socket = BlockedSocket
+
+        # Patch connect in place instead of swapping in a socket subclass:
+        # allowed local connections then only pay one frozenset probe plus a
+        # call through the cached original method, and code holding a direct
+        # reference to socket.socket is covered too
+        if getattr(socket.socket.connect, "_privacy_guard", False):
+            return  # Already patched
+
+        original_connect = socket.socket.connect
+        allowed_hosts = self._ALLOWED_HOSTS
+
+        def _checked_connect(sock, address):
+            host, port = address[0], address[1]
+            # Allow local connections
+            if host in allowed_hosts:
+                return original_connect(sock, address)
+
+            raise ConnectionError(
+                f"Privacy violation: External connection to {host}:{port} blocked. "
+                f"System is in strict offline mode."
+            )
+
+        _checked_connect._privacy_guard = True
+        socket.socket.connect = _checked_connect
     
+    def _anonymize_str(self, value: str) -> str:
+        """Hash a single string with the session salt for consistent anonymization"""
+        h = self._hash_proto.copy()
+        h.update(value.encode())
+        return h.hexdigest()[:16]
+
     def anonymize_data(self, data: Any) -> Any:
         """Anonymize sensitive data"""
         if isinstance(data, str):
-            # Hash with salt for consistent anonymization
-            return hashlib.sha256(f"{data}{self.anonymization_salt}".encode()).hexdigest()[:16]
-        elif isinstance(data, dict):
-            return {self.anonymize_data(k): self.anonymize_data(v) for k, v in data.items()}
-        elif isinstance(data, list):
-            return [self.anonymize_data(item) for item in data]
-        return data
+            return self._anonymize_str(data)
+        if not isinstance(data, (dict, list)):
+            return data
+
+        # Iterative worklist instead of recursion: deeply nested payloads
+        # would otherwise pay a Python call frame per node (and can blow the
+        # recursion limit)
+        anonymize_str = self._anonymize_str
+
+        def _convert(value, stack):
+            if isinstance(value, str):
+                return anonymize_str(value)
+            if isinstance(value, dict):
+                child = {}
+                stack.append((value, child))
+                return child
+            if isinstance(value, list):
+                child = []
+                stack.append((value, child))
+                return child
+            return value
+
+        result = {} if isinstance(data, dict) else []
+        stack = [(data, result)]
+        while stack:
+            src, dst = stack.pop()
+            if isinstance(src, dict):
+                for k, v in src.items():
+                    key = anonymize_str(k) if isinstance(k, str) else k
+                    dst[key] = _convert(v, stack)
+            else:
+                dst.extend(_convert(item, stack) for item in src)
+        return result
     
     def encrypt_sensitive_data(self, data: str) -> str:
         """Encrypt sensitive data before storage"""
-        from cryptography.fernet import Fernet
+        from cryptography.hazmat.primitives.ciphers.aead import AESGCM
         import base64
-        
-        # Generate Fernet key from our encryption key (needs to be 32 url-safe base64-encoded bytes)
-        # hashlib gives 32 bytes, we allow Fernet to generate its own valid key for this session
-        # Real impl would manage keys better
-        fernet_key = base64.urlsafe_b64encode(self.encryption_key)
-        cipher = Fernet(fernet_key)
-        
-        encrypted = cipher.encrypt(data.encode())
-        
-        # Store both encrypted data and key (key should be in secure storage)
-        return json.dumps({
-            "encrypted": encrypted.decode(),
-            "key": fernet_key.decode()
-        })
+
+        # AES-GCM runs on AES-NI/PCLMULQDQ hardware paths and is far faster
+        # than Fernet's CBC+HMAC for bulk payloads. The key is fixed for the
+        # session, so build the cipher once and reuse it.
+        if self._aesgcm is None:
+            self._aesgcm = AESGCM(self.encryption_key)
+
+        nonce = os.urandom(12)
+        encrypted = self._aesgcm.encrypt(nonce, data.encode(), None)
+
+        # Nonce is prepended so the blob is self-contained for decryption
+        return base64.b64encode(nonce + encrypted).decode()
     
     def store_local_only(self, data: Dict[str, Any], task_id: str) -> str:
         """Store data locally with privacy controls"""
@@ -115,16 +172,31 @@ class PrivacyManager:
         
         # Encrypt if needed
         if self.data_retention_policy == DataRetentionPolicy.ENCRYPTED_CLOUD:
-            encrypted = self.encrypt_sensitive_data(json.dumps(anonymized))
+            if orjson is not None:
+                serialized = orjson.dumps(anonymized).decode()
+            else:
+                serialized = json.dumps(anonymized)
+            encrypted = self.encrypt_sensitive_data(serialized)
             storage_data = {"encrypted": True, "data": encrypted}
         else:
             storage_data = {"encrypted": False, "data": anonymized}
-        
-        # Save to local cache
+
+        # Save to local cache: serialize fully, then write in one shot so the
+        # whole store is open+write+close plus at most one stat for the
+        # size bookkeeping
         cache_file = self.local_cache_dir / f"task_{task_id}.json"
-        with open(cache_file, 'w') as f:
-            json.dump(storage_data, f, indent=2)
-        
+        if orjson is not None:
+            payload = orjson.dumps(storage_data, option=orjson.OPT_INDENT_2)
+        else:
+            payload = json.dumps(storage_data, indent=2).encode()
+
+        try:
+            self._cache_bytes -= cache_file.stat().st_size
+        except OSError:
+            pass  # New task file
+        cache_file.write_bytes(payload)
+        self._cache_bytes += len(payload)
+
         return str(cache_file)
     
     def cleanup_sensitive_data(self, task_id: str):
@@ -132,9 +204,19 @@ class PrivacyManager:
         if self.data_retention_policy == DataRetentionPolicy.AUTO_PURGE:
             cache_file = self.local_cache_dir / f"task_{task_id}.json"
             if cache_file.exists():
-                # Secure delete (overwrite before removal)
+                size = cache_file.stat().st_size
+                self._cache_bytes -= size
+                # Secure delete (overwrite before removal): zero-fill in
+                # bounded chunks rather than materializing os.urandom(size)
+                # in RAM — zeros wipe the plaintext just as well and skip the
+                # CSPRNG cost entirely
+                zeros = b'\0' * min(size, 1 << 20)
                 with open(cache_file, 'wb') as f:
-                    f.write(os.urandom(cache_file.stat().st_size))
+                    remaining = size
+                    while remaining > 0:
+                        remaining -= f.write(zeros[:remaining] if remaining < len(zeros) else zeros)
+                    f.flush()
+                    os.fsync(f.fileno())
                 cache_file.unlink()
     
     def generate_privacy_report(self) -> Dict[str, Any]:
@@ -142,7 +224,7 @@ class PrivacyManager:
         return {
             "privacy_level": self.privacy_level.value,
             "data_retention_policy": self.data_retention_policy.value,
-            "local_cache_size": sum(f.stat().st_size for f in self.local_cache_dir.glob('*')),
+            "local_cache_size": self._cache_bytes,
             "blocked_domains_count": len(self.blocked_domains),
             "encryption_enabled": self.data_retention_policy == DataRetentionPolicy.ENCRYPTED_CLOUD
         }
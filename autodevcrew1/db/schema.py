@@ -16,6 +16,7 @@ CREATE TABLE IF NOT EXISTS test_logs (
     id INTEGER PRIMARY KEY AUTOINCREMENT,
     task_id INTEGER,
     test_results TEXT NOT NULL,
+    test_passed INTEGER,
     FOREIGN KEY (task_id) REFERENCES tasks(id)
 );
 
@@ -23,6 +24,7 @@ CREATE TABLE IF NOT EXISTS deployment_logs (
     id INTEGER PRIMARY KEY AUTOINCREMENT,
     task_id INTEGER,
     deployment_status TEXT NOT NULL,
+    deploy_ok INTEGER,
     FOREIGN KEY (task_id) REFERENCES tasks(id)
 );
 
@@ -32,4 +34,16 @@ CREATE TABLE IF NOT EXISTS final_reports (
     summary TEXT NOT NULL,
     FOREIGN KEY (task_id) REFERENCES tasks(id)
 );
+
+-- Every artifact lookup filters on task_id; without these indexes each
+-- lookup is a full table scan
+CREATE INDEX IF NOT EXISTS idx_generated_code_task ON generated_code(task_id);
+CREATE INDEX IF NOT EXISTS idx_test_logs_task ON test_logs(task_id);
+CREATE INDEX IF NOT EXISTS idx_deployment_logs_task ON deployment_logs(task_id);
+CREATE INDEX IF NOT EXISTS idx_final_reports_task ON final_reports(task_id);
+
+-- WAL lets readers proceed alongside a writer; NORMAL sync cuts fsync
+-- frequency while staying crash-safe under WAL
+PRAGMA journal_mode=WAL;
+PRAGMA synchronous=NORMAL;
 """
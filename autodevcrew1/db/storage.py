@@ -1,61 +1,248 @@
 import sqlite3
 import json
+import os
+import queue
+import threading
+from contextlib import contextmanager
 from db.schema import SCHEMA_SQL
 
+try:
+    import orjson  # Optional: C-accelerated JSON for the report blobs
+except ImportError:
+    orjson = None
+
+def _dumps(obj):
+    # final_reports.summary is TEXT, so decode orjson's bytes output
+    return orjson.dumps(obj).decode() if orjson is not None else json.dumps(obj)
+
+def _loads(buf):
+    return orjson.loads(buf) if orjson is not None else json.loads(buf)
+
 DB_NAME = "autodevcrew.db"
 
-def get_connection():
-    conn = sqlite3.connect(DB_NAME)
+# Per-connection tuning: WAL lets readers run alongside the writer, NORMAL
+# sync cuts per-commit fsyncs (still crash-safe under WAL), temp tables and a
+# larger page cache stay in memory, and the busy timeout stops concurrent
+# agent runs from surfacing "database is locked"
+_PRAGMAS = (
+    "PRAGMA journal_mode=WAL",
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA cache_size=-64000",
+    "PRAGMA busy_timeout=30000",
+    # Raise the checkpoint interval from the 1000-page default to ~16MB of
+    # WAL (4096 pages at 4KB): the log-style append workload here benefits
+    # from fewer, larger checkpoints, and readers keep the WAL from growing
+    # unbounded anyway
+    "PRAGMA wal_autocheckpoint=4096",
+)
+
+# Module-level SQL constants: passing the same string object on every call
+# keeps sqlite3's per-connection prepared-statement LRU hitting, so each
+# statement is parsed and planned once per pooled connection
+_SQL_INSERT_TASK = "INSERT INTO tasks (description) VALUES (?)"
+_SQL_INSERT_CODE = "INSERT INTO generated_code (task_id, code) VALUES (?, ?)"
+_SQL_INSERT_TEST_LOG = "INSERT INTO test_logs (task_id, test_results, test_passed) VALUES (?, ?, ?)"
+_SQL_INSERT_DEPLOY_LOG = "INSERT INTO deployment_logs (task_id, deployment_status, deploy_ok) VALUES (?, ?, ?)"
+_SQL_INSERT_REPORT = "INSERT INTO final_reports (task_id, summary) VALUES (?, ?)"
+_SQL_SELECT_SUMMARY = "SELECT summary FROM final_reports WHERE task_id = ?"
+_SQL_SELECT_RECORD = """
+    SELECT t.id, t.description, t.created_at,
+           gc.code, tl.test_results, tl.test_passed,
+           dl.deployment_status, dl.deploy_ok, fr.summary
+    FROM tasks t
+    LEFT JOIN generated_code gc ON gc.task_id = t.id
+    LEFT JOIN test_logs tl ON tl.task_id = t.id
+    LEFT JOIN deployment_logs dl ON dl.task_id = t.id
+    LEFT JOIN final_reports fr ON fr.task_id = t.id
+    WHERE t.id = ?
+"""
+
+# Pass/fail flags are derived once at write time so readers (dashboards,
+# history views) filter on an integer instead of substring-scanning logs
+def _test_passed_flag(test_results):
+    return 1 if "PASSED" in str(test_results) else 0
+
+def _deploy_ok_flag(deployment_status):
+    return 1 if "\u2705" in str(deployment_status) else 0
+
+def get_connection(check_same_thread=True):
+    conn = sqlite3.connect(DB_NAME, check_same_thread=check_same_thread,
+                           cached_statements=256)
     conn.row_factory = sqlite3.Row
+    for pragma in _PRAGMAS:
+        conn.execute(pragma)
     return conn
 
+class _ConnectionPool:
+    """Bounded pool of reusable, pre-tuned SQLite connections.
+
+    Opening a fresh connection per save_*/get_* call throws away SQLite's
+    per-connection page cache every time and pays the file-open cost on each
+    write. Pooled connections keep the cache warm across calls; under WAL a
+    writer and several readers can proceed concurrently.
+    """
+
+    def __init__(self, size=None):
+        self._max_idle = size or (os.cpu_count() or 4)
+        self._idle = queue.Queue(maxsize=self._max_idle)
+
+    def _open(self):
+        # Shared-cache mode lets pooled connections in this process share one
+        # page cache instead of each holding a private 64MB copy
+        conn = sqlite3.connect(f"file:{DB_NAME}?cache=shared&mode=rwc", uri=True,
+                               check_same_thread=False, cached_statements=256)
+        conn.row_factory = sqlite3.Row
+        for pragma in _PRAGMAS:
+            conn.execute(pragma)
+        return conn
+
+    @contextmanager
+    def acquire(self):
+        try:
+            conn = self._idle.get_nowait()
+        except queue.Empty:
+            conn = self._open()
+        broken = False
+        try:
+            yield conn
+        except Exception:
+            # A failed statement can leave an implicit transaction open;
+            # roll it back so the connection goes back to the pool clean,
+            # and drop the connection entirely if even that fails
+            try:
+                conn.rollback()
+            except sqlite3.Error:
+                broken = True
+            raise
+        finally:
+            if broken:
+                conn.close()
+            else:
+                try:
+                    self._idle.put_nowait(conn)
+                except queue.Full:
+                    conn.close()
+
+_pool = _ConnectionPool()
+
+# SQLite allows one writer at a time; serializing writers here means threads
+# queue on a cheap in-process lock instead of spinning in sqlite3's busy
+# handler against the database file
+_WRITE_LOCK = threading.Lock()
+
+_schema_ready = False
+
 def init_db():
+    global _schema_ready
     conn = get_connection()
     conn.executescript(SCHEMA_SQL)
+    # Migrate databases created before the flag columns existed; ALTER TABLE
+    # fails harmlessly once the column is present
+    for stmt in ("ALTER TABLE test_logs ADD COLUMN test_passed INTEGER",
+                 "ALTER TABLE deployment_logs ADD COLUMN deploy_ok INTEGER"):
+        try:
+            conn.execute(stmt)
+        except sqlite3.OperationalError:
+            pass
     conn.commit()
     conn.close()
+    _schema_ready = True
+
+def _ensure_schema():
+    # Running the CREATE TABLE IF NOT EXISTS script on every save_task is
+    # wasted parsing after the first call; the flag makes it once per process
+    if not _schema_ready:
+        init_db()
 
 def save_task(description):
-    init_db()  # Ensure DB is initialized
-    conn = get_connection()
-    cursor = conn.cursor()
-    cursor.execute("INSERT INTO tasks (description) VALUES (?)", (description,))
-    task_id = cursor.lastrowid
-    conn.commit()
-    conn.close()
+    _ensure_schema()
+    with _WRITE_LOCK, _pool.acquire() as conn:
+        cursor = conn.execute(_SQL_INSERT_TASK, (description,))
+        task_id = cursor.lastrowid
+        conn.commit()
     return task_id
 
 def save_code(task_id, code):
-    conn = get_connection()
-    conn.execute("INSERT INTO generated_code (task_id, code) VALUES (?, ?)", (task_id, code))
-    conn.commit()
-    conn.close()
+    with _WRITE_LOCK, _pool.acquire() as conn:
+        conn.execute(_SQL_INSERT_CODE, (task_id, code))
+        conn.commit()
+
+def save_codes(task_id, codes):
+    """Bulk-insert multiple generated files for one task.
+
+    A single executemany inside one transaction replaces the per-row
+    insert+commit loop callers would otherwise run for multi-file outputs.
+    """
+    with _WRITE_LOCK, _pool.acquire() as conn:
+        conn.executemany(_SQL_INSERT_CODE, [(task_id, code) for code in codes])
+        conn.commit()
 
 def save_test_log(task_id, test_results):
-    conn = get_connection()
-    conn.execute("INSERT INTO test_logs (task_id, test_results) VALUES (?, ?)", (task_id, test_results))
-    conn.commit()
-    conn.close()
+    with _WRITE_LOCK, _pool.acquire() as conn:
+        conn.execute(_SQL_INSERT_TEST_LOG, (task_id, test_results, _test_passed_flag(test_results)))
+        conn.commit()
+
+def save_test_logs(task_id, test_results_list):
+    """Bulk-insert multiple test logs for one task in a single transaction"""
+    with _WRITE_LOCK, _pool.acquire() as conn:
+        conn.executemany(_SQL_INSERT_TEST_LOG, [(task_id, results, _test_passed_flag(results)) for results in test_results_list])
+        conn.commit()
 
 def save_deployment_log(task_id, deployment_status):
-    conn = get_connection()
-    conn.execute("INSERT INTO deployment_logs (task_id, deployment_status) VALUES (?, ?)", (task_id, deployment_status))
-    conn.commit()
-    conn.close()
+    with _WRITE_LOCK, _pool.acquire() as conn:
+        conn.execute(_SQL_INSERT_DEPLOY_LOG, (task_id, deployment_status, _deploy_ok_flag(deployment_status)))
+        conn.commit()
 
 def save_final_report(task_id, summary):
     # summary is a dict, serialize it
-    summary_json = json.dumps(summary)
-    conn = get_connection()
-    conn.execute("INSERT INTO final_reports (task_id, summary) VALUES (?, ?)", (task_id, summary_json))
-    conn.commit()
-    conn.close()
+    summary_json = _dumps(summary)
+    with _WRITE_LOCK, _pool.acquire() as conn:
+        conn.execute(_SQL_INSERT_REPORT, (task_id, summary_json))
+        conn.commit()
+
+def save_task_bundle(task_id, code, test_results, deployment_status, summary):
+    """Persist all end-of-task artifacts in a single transaction.
+
+    Calling the four save_* helpers individually commits (and fsyncs) four
+    times per task; bundling the inserts under one BEGIN IMMEDIATE cuts that
+    to a single commit.
+    """
+    summary_json = _dumps(summary)
+    with _WRITE_LOCK, _pool.acquire() as conn:
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            conn.execute(_SQL_INSERT_CODE, (task_id, code))
+            conn.execute(_SQL_INSERT_TEST_LOG, (task_id, test_results, _test_passed_flag(test_results)))
+            conn.execute(_SQL_INSERT_DEPLOY_LOG, (task_id, deployment_status, _deploy_ok_flag(deployment_status)))
+            conn.execute(_SQL_INSERT_REPORT, (task_id, summary_json))
+            conn.commit()
+        except Exception:
+            conn.rollback()
+            raise
+
+def get_task_record(task_id):
+    """Fetch a task and all of its artifacts in one joined query.
+
+    Task records are always read back whole, so a single JOIN replaces four
+    separate round-trips against the artifact tables.
+    """
+    with _pool.acquire() as conn:
+        cursor = conn.execute(_SQL_SELECT_RECORD, (task_id,))
+        row = cursor.fetchone()
+    if row is None:
+        return None
+    record = dict(row)
+    if record.get('summary'):
+        record['summary'] = _loads(record['summary'])
+    return record
 
 def get_task_summary(task_id):
-    conn = get_connection()
-    cursor = conn.execute("SELECT summary FROM final_reports WHERE task_id = ?", (task_id,))
-    row = cursor.fetchone()
-    conn.close()
+    with _pool.acquire() as conn:
+        cursor = conn.execute(_SQL_SELECT_SUMMARY, (task_id,))
+        row = cursor.fetchone()
     if row:
-        return json.loads(row['summary'])
+        # Single-column query: positional access skips sqlite3.Row's
+        # case-insensitive name lookup
+        return _loads(row[0])
     return None
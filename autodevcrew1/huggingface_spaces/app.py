@@ -3,8 +3,10 @@ AutoDevCrew - HuggingFace Spaces Deployment
 Streamlit-based multi-agent SDLC automation system
 """
 
+import asyncio
 import os
 import sys
+import threading
 import streamlit as st
 
 # Add project root to path
@@ -17,6 +19,22 @@ os.environ["PRIVACY_LEVEL"] = "moderate"  # Moderate privacy on HF
 os.environ["LIGHTWEIGHT_MODE"] = "true"
 os.environ["QUANTIZATION"] = "int4"
 
+# One background event loop for the whole Space: asyncio.run() builds and
+# tears down a fresh loop (and its selector) per submitted task, which adds
+# up under Streamlit's rerun model. Held in st.cache_resource because each
+# rerun gets a fresh module namespace - a module global would leak a new
+# loop and daemon thread per submission
+@st.cache_resource(show_spinner=False)
+def _get_background_loop():
+    loop = asyncio.new_event_loop()
+    threading.Thread(target=loop.run_forever, daemon=True,
+                     name="autodevcrew-loop").start()
+    return loop
+
+def _run_async(coro):
+    """Run a coroutine on the persistent loop and wait for its result"""
+    return asyncio.run_coroutine_threadsafe(coro, _get_background_loop()).result()
+
 # Import the main Streamlit app
 # Since the original streamlit_app.py is in ui/, we'll import it
 try:
@@ -65,11 +83,14 @@ except ImportError:
         with st.spinner("🤖 Agents are working..."):
             try:
                 # Import and run
-                import asyncio
                 from main import AutoDevCrew
-                
-                # Initialize
-                autodevcrew = AutoDevCrew(config_path="config/development.yaml")
+
+                # Initialize once per session: AutoDevCrew construction loads
+                # config and wires up every agent, which Streamlit would
+                # otherwise repeat on each rerun
+                if "autodevcrew" not in st.session_state:
+                    st.session_state.autodevcrew = AutoDevCrew(config_path="config/development.yaml")
+                autodevcrew = st.session_state.autodevcrew
                 
                 # Process task
                 async def run_task():
@@ -79,7 +100,7 @@ except ImportError:
                         priority=priority
                     )
                 
-                result = asyncio.run(run_task())
+                result = _run_async(run_task())
                 
                 if result.get("success"):
                     st.success("✅ Task completed successfully!")
@@ -129,11 +150,18 @@ except ImportError:
         
         # System status
         st.header("📊 System Status")
-        try:
+
+        @st.cache_resource(show_spinner=False)
+        def _performance_report():
+            # Hardware probing is identical on every rerun; cache it for the
+            # life of the Space process
             from core.lightweight_mode import LightweightMode
-            lm = LightweightMode()
-            report = lm.get_performance_report()
-            
+            return LightweightMode().get_performance_report()
+
+        try:
+            report = _performance_report()
+
+
             st.metric("RAM", f"{report['hardware_profile']['ram_gb']:.1f} GB")
             st.metric("CPU Cores", report['hardware_profile']['cpu_cores'])
             st.metric("Quantization", report['quantization_level'])
@@ -1,14 +1,198 @@
+import io
+import textwrap
 import os
-import yaml
 import json
 import base64
 from pathlib import Path
 from typing import Dict, Any, Optional, List
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from datetime import datetime
 import hmac
 import hashlib
 
+# Resolved on first workflow dump: webhook-only deployments never pay for
+# loading PyYAML (and libyaml) at import time
+_yaml_dump = None
+
+def _dump_yaml(data):
+    global _yaml_dump
+    if _yaml_dump is None:
+        import yaml
+        try:
+            from yaml import CSafeDumper as dumper  # libyaml C emitter
+        except ImportError:
+            from yaml import SafeDumper as dumper
+        import functools
+        _yaml_dump = functools.partial(yaml.dump, Dumper=dumper, default_flow_style=False)
+    return _yaml_dump(data)
+
+try:
+    import ijson  # Optional: streaming JSON so big webhook bodies aren't fully materialized
+except ImportError:
+    ijson = None
+
+# The only webhook fields process_webhook_event ever reads
+_WEBHOOK_KEYS = frozenset({
+    "action",
+    "issue.title", "issue.body", "issue.number", "issue.user.login",
+    "pull_request.title", "pull_request.head.ref", "pull_request.user.login",
+})
+
+def _parse_webhook_payload(raw_body: bytes) -> Dict[str, Any]:
+    """Parse a webhook body down to just the fields the handler uses.
+
+    GitHub webhook payloads run to tens of kilobytes, mostly repository and
+    sender metadata we never look at. With ijson available we stream the body
+    and keep only the whitelisted keys; otherwise fall back to json.loads.
+    """
+    if ijson is None:
+        return json.loads(raw_body)
+    payload: Dict[str, Any] = {}
+    for prefix, event, value in ijson.parse(io.BytesIO(raw_body)):
+        if event in ("string", "number") and prefix in _WEBHOOK_KEYS:
+            parts = prefix.split(".")
+            node = payload
+            for part in parts[:-1]:
+                node = node.setdefault(part, {})
+            node[parts[-1]] = value
+    return payload
+
+# Pre-rendered GitHub Actions workflow fragments. The workflow is static
+# apart from its name and optional extra steps, so rendering it through a
+# dict -> yaml.dump pipeline on every call bought nothing; string splicing
+# assembles the same document without touching the YAML emitter.
+_WORKFLOW_HEAD = r"""name: __WORKFLOW_NAME__
+'on':
+  workflow_dispatch:
+    inputs:
+      task_description:
+        description: AutoDevCrew task description
+        required: true
+        type: string
+      environment:
+        description: Deployment environment
+        required: false
+        default: development
+        type: choice
+        options:
+        - development
+        - staging
+        - production
+  push:
+    branches:
+    - main
+    - master
+    paths:
+    - src/**
+    - requirements.txt
+  pull_request:
+    branches:
+    - main
+    - master
+jobs:
+  autodevcrew-pipeline:
+    runs-on: ubuntu-latest
+    strategy:
+      matrix:
+        python-version:
+        - '3.9'
+        - '3.10'
+        - '3.11'
+"""
+
+_WORKFLOW_STEPS = r"""    steps:
+    - name: Checkout repository
+      uses: actions/checkout@v3
+    - name: Set up Python
+      uses: actions/setup-python@v4
+      with:
+        python-version: ${{ matrix.python-version }}
+    - name: Install dependencies
+      run: pip install -r requirements.txt
+    - name: Run AutoDevCrew
+      env:
+        GITHUB_TOKEN: ${{ secrets.GITHUB_TOKEN }}
+        TASK_DESCRIPTION: ${{ github.event.inputs.task_description }}
+        ENVIRONMENT: ${{ github.event.inputs.environment }}
+      run: "\n                    python -c \"\n                    from main import AutoDevCrew\n\
+        \                    import asyncio\n                    import os\n         \
+        \           \n                    async def run():\n                        autodevcrew\
+        \ = AutoDevCrew()\n                        result = await autodevcrew.process_task(\n\
+        \                            os.getenv('TASK_DESCRIPTION'),\n                \
+        \            project_name='github-actions',\n                            priority='high'\n\
+        \                        )\n                        return result\n          \
+        \          \n                    result = asyncio.run(run())\n               \
+        \     print('Task completed:', result['success'])\n                    \"\n  \
+        \                  "
+    - name: Upload artifacts
+      uses: actions/upload-artifact@v3
+      with:
+        name: autodevcrew-output
+        path: 'db/
+
+          generated_code/
+
+          reports/'
+    - name: Create PR with generated code
+      if: success()
+      run: "\n                        git config --global user.name 'github-actions[bot]'\n\
+        \                        git config --global user.email 'github-actions[bot]@users.noreply.github.com'\n\
+        \                        git checkout -b feature/autodevcrew-${{ github.run_id\
+        \ }}\n                        git add .\n                        git commit -m\
+        \ \"AutoDevCrew: Generated code for task\"\n                        git push origin\
+        \ feature/autodevcrew-${{ github.run_id }}\n                        gh pr create\
+        \ --title \"AutoDevCrew: Generated Implementation\" --body \"This PR contains\
+        \ code generated by AutoDevCrew\"\n                    "
+      env:
+        GITHUB_TOKEN: ${{ secrets.GITHUB_TOKEN }}
+"""
+
+_WORKFLOW_DEPLOY = r"""  deploy:
+    runs-on: ubuntu-latest
+    needs:
+    - autodevcrew-pipeline
+    if: github.event.inputs.environment == 'production'
+    steps:
+    - name: Deploy to production
+      run: echo 'Deploying generated code to production...'
+"""
+
+# Fully static security-scan workflow, rendered once at authoring time
+_SECURITY_SCAN_YAML = r"""jobs:
+  security-scan:
+    runs-on: ubuntu-latest
+    steps:
+    - name: Checkout code
+      uses: actions/checkout@v3
+    - name: Run AutoDevCrew Security Scan
+      run: "\n                                python -c \"\n                                from
+        agents.tester_agent import TesterAgent\n                                import
+        os\n                                \n                                tester
+        = TesterAgent()\n                                \n                                #
+        Scan all Python files\n                                import glob\n                                security_issues
+        = []\n                                \n                                for
+        py_file in glob.glob('**/*.py', recursive=True):\n                                    with
+        open(py_file, 'r') as f:\n                                        code = f.read()\n
+        \                                   \n                                    results
+        = tester.run_security_tests(code)\n                                    if
+        results['failed'] > 0:\n                                        security_issues.append({\n
+        \                                           'file': py_file,\n                                            'issues':
+        results['detailed_report']\n                                        })\n                                \n
+        \                               if security_issues:\n                                    print('Security
+        issues found:')\n                                    for issue in security_issues:\n
+        \                                       print(f'  - {issue[\"file\"]}: {len(issue[\"issues\"])}
+        issues')\n                                    exit(1)\n                                else:\n
+        \                                   print('\u2705 No security issues found')\n
+        \                               \"\n                            "
+name: Security Scan with AutoDevCrew
+'on':
+- push
+- pull_request
+"""
+
+
 class GitHubIntegration:
     def __init__(self, github_token: Optional[str] = None, repo: Optional[str] = None):
         self.github_token = github_token or os.getenv("GITHUB_TOKEN")
@@ -18,138 +202,33 @@ class GitHubIntegration:
             "Authorization": f"token {self.github_token}",
             "Accept": "application/vnd.github.v3+json"
         }
+        # One pooled session per integration: reuses the TLS connection to
+        # api.github.com across calls and retries transient gateway errors
+        self.session = requests.Session()
+        self.session.headers.update(self.headers)
+        self.session.mount("https://", HTTPAdapter(
+            pool_connections=4,
+            pool_maxsize=8,
+            max_retries=Retry(total=3, backoff_factor=0.3,
+                              status_forcelist=(502, 503, 504)),
+        ))
     
     def create_actions_workflow(self, task_id: str, workflow_config: Dict[str, Any]) -> str:
         """Generate GitHub Actions workflow YAML"""
-        
+
         workflow_name = f"autodevcrew-{task_id}"
-        
-        workflow = {
-            "name": workflow_name,
-            "on": {
-                "workflow_dispatch": {
-                    "inputs": {
-                        "task_description": {
-                            "description": "AutoDevCrew task description",
-                            "required": True,
-                            "type": "string"
-                        },
-                        "environment": {
-                            "description": "Deployment environment",
-                            "required": False,
-                            "default": "development",
-                            "type": "choice",
-                            "options": ["development", "staging", "production"]
-                        }
-                    }
-                },
-                "push": {
-                    "branches": ["main", "master"],
-                    "paths": ["src/**", "requirements.txt"]
-                },
-                "pull_request": {
-                    "branches": ["main", "master"]
-                }
-            },
-            "jobs": {
-                "autodevcrew-pipeline": {
-                    "runs-on": "ubuntu-latest",
-                    "strategy": {
-                        "matrix": {
-                            "python-version": ["3.9", "3.10", "3.11"]
-                        }
-                    },
-                    "steps": [
-                        {
-                            "name": "Checkout repository",
-                            "uses": "actions/checkout@v3"
-                        },
-                        {
-                            "name": "Set up Python",
-                            "uses": "actions/setup-python@v4",
-                            "with": {
-                                "python-version": "${{ matrix.python-version }}"
-                            }
-                        },
-                        {
-                            "name": "Install dependencies",
-                            "run": "pip install -r requirements.txt"
-                        },
-                        {
-                            "name": "Run AutoDevCrew",
-                            "env": {
-                                "GITHUB_TOKEN": "${{ secrets.GITHUB_TOKEN }}",
-                                "TASK_DESCRIPTION": "${{ github.event.inputs.task_description }}",
-                                "ENVIRONMENT": "${{ github.event.inputs.environment }}"
-                            },
-                            "run": """
-                            python -c "
-                            from main import AutoDevCrew
-                            import asyncio
-                            import os
-                            
-                            async def run():
-                                autodevcrew = AutoDevCrew()
-                                result = await autodevcrew.process_task(
-                                    os.getenv('TASK_DESCRIPTION'),
-                                    project_name='github-actions',
-                                    priority='high'
-                                )
-                                return result
-                            
-                            result = asyncio.run(run())
-                            print('Task completed:', result['success'])
-                            "
-                            """
-                        },
-                        {
-                            "name": "Upload artifacts",
-                            "uses": "actions/upload-artifact@v3",
-                            "with": {
-                                "name": "autodevcrew-output",
-                                "path": "db/\ngenerated_code/\nreports/"
-                            }
-                        },
-                        {
-                            "name": "Create PR with generated code",
-                            "if": "success()",
-                            "run": """
-                                git config --global user.name 'github-actions[bot]'
-                                git config --global user.email 'github-actions[bot]@users.noreply.github.com'
-                                git checkout -b feature/autodevcrew-${{ github.run_id }}
-                                git add .
-                                git commit -m "AutoDevCrew: Generated code for task"
-                                git push origin feature/autodevcrew-${{ github.run_id }}
-                                gh pr create --title "AutoDevCrew: Generated Implementation" --body "This PR contains code generated by AutoDevCrew"
-                            """,
-                            "env": {
-                                "GITHUB_TOKEN": "${{ secrets.GITHUB_TOKEN }}"
-                            }
-                        }
-                    ]
-                },
-                "deploy": {
-                    "runs-on": "ubuntu-latest",
-                    "needs": ["autodevcrew-pipeline"],
-                    "if": "github.event.inputs.environment == 'production'",
-                    "steps": [
-                        {
-                            "name": "Deploy to production",
-                            "run": "echo 'Deploying generated code to production...'"
-                        }
-                    ]
-                }
-            }
-        }
-        
-        # Add custom steps from config
+
+        parts = [_WORKFLOW_HEAD.replace("__WORKFLOW_NAME__", workflow_name),
+                 _WORKFLOW_STEPS]
+
+        # Only custom steps from config need a live YAML dump
         if workflow_config.get("additional_steps"):
-            workflow["jobs"]["autodevcrew-pipeline"]["steps"].extend(
-                workflow_config["additional_steps"]
-            )
-        
-        return yaml.dump(workflow, default_flow_style=False)
-    
+            extra = _dump_yaml(workflow_config["additional_steps"])
+            parts.append(textwrap.indent(extra, "    "))
+
+        parts.append(_WORKFLOW_DEPLOY)
+        return "".join(parts)
+
     def trigger_real_ci_cd(self, task_description: str, branch: str = "main") -> Dict[str, Any]:
         """Trigger actual CI/CD pipeline through GitHub Actions"""
         
@@ -167,7 +246,7 @@ class GitHubIntegration:
             }
         }
         
-        response = requests.post(url, headers=self.headers, json=payload)
+        response = self.session.post(url, json=payload, timeout=10)
         
         if response.status_code == 204:
             return {
@@ -201,7 +280,7 @@ class GitHubIntegration:
             }
         }
         
-        response = requests.post(url, headers=self.headers, json=payload)
+        response = self.session.post(url, json=payload, timeout=10)
         
         if response.status_code == 201:
             hook_data = response.json()
@@ -217,19 +296,32 @@ class GitHubIntegration:
                 "error": response.text
             }
     
-    def process_webhook_event(self, payload: Dict[str, Any], signature: str, secret: str) -> Dict[str, Any]:
-        """Process incoming GitHub webhook events"""
-        
-        # Verify signature
-        expected_signature = hmac.new(
-            secret.encode(),
-            json.dumps(payload).encode(),
-            hashlib.sha256
-        ).hexdigest()
-        
-        if not hmac.compare_digest(f"sha256={expected_signature}", signature):
+    def process_webhook_event(self, raw_body: bytes, signature: str, secret: str,
+                              parsed: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        """Process incoming GitHub webhook events.
+
+        Takes the raw request body so the HMAC runs over the exact bytes
+        GitHub signed — re-serializing a parsed payload costs a dict->str->
+        bytes round trip and breaks the signature on any key-order
+        difference. Pass `parsed` to skip the JSON parse if the caller
+        already has it.
+        """
+
+        # Verify signature. Comparing raw digests skips hex-encoding our side
+        # and the "sha256=" f-string build on every event; decoding the header
+        # once is cheaper than encoding the digest.
+        try:
+            received_digest = bytes.fromhex(signature.removeprefix("sha256="))
+        except ValueError:
             return {"error": "Invalid signature"}
-        
+        expected_digest = hmac.new(secret.encode(), raw_body, hashlib.sha256).digest()
+
+        if not hmac.compare_digest(expected_digest, received_digest):
+            return {"error": "Invalid signature"}
+
+        # Only parse after the signature checks out
+        payload = parsed if parsed is not None else _parse_webhook_payload(raw_body)
+
         event_type = payload.get("action", "unknown")
         
         if event_type == "opened" and "issue" in payload:
@@ -291,7 +383,7 @@ class GitHubIntegration:
             "labels": ["autodevcrew", "generated"]
         }
         
-        response = requests.post(url, headers=self.headers, json=payload)
+        response = self.session.post(url, json=payload, timeout=10)
         
         if response.status_code == 201:
             issue_data = response.json()
@@ -308,58 +400,7 @@ class GitHubIntegration:
     
     def generate_security_scan_workflow(self) -> str:
         """Generate security scanning workflow"""
-        
-        workflow = {
-            "name": "Security Scan with AutoDevCrew",
-            "on": ["push", "pull_request"],
-            "jobs": {
-                "security-scan": {
-                    "runs-on": "ubuntu-latest",
-                    "steps": [
-                        {
-                            "name": "Checkout code",
-                            "uses": "actions/checkout@v3"
-                        },
-                        {
-                            "name": "Run AutoDevCrew Security Scan",
-                            "run": """
-                                python -c "
-                                from agents.tester_agent import TesterAgent
-                                import os
-                                
-                                tester = TesterAgent()
-                                
-                                # Scan all Python files
-                                import glob
-                                security_issues = []
-                                
-                                for py_file in glob.glob('**/*.py', recursive=True):
-                                    with open(py_file, 'r') as f:
-                                        code = f.read()
-                                    
-                                    results = tester.run_security_tests(code)
-                                    if results['failed'] > 0:
-                                        security_issues.append({
-                                            'file': py_file,
-                                            'issues': results['detailed_report']
-                                        })
-                                
-                                if security_issues:
-                                    print('Security issues found:')
-                                    for issue in security_issues:
-                                        print(f'  - {issue[\"file\"]}: {len(issue[\"issues\"])} issues')
-                                    exit(1)
-                                else:
-                                    print('✅ No security issues found')
-                                "
-                            """
-                        }
-                    ]
-                }
-            }
-        }
-        
-        return yaml.dump(workflow, default_flow_style=False)
+        return _SECURITY_SCAN_YAML
     def generate_workflow(self, output_path: str):
         """Generate a default AutoDevCrew workflow and save it to a file"""
         workflow_yaml = self.create_actions_workflow("main", {})
@@ -1,26 +1,50 @@
 import asyncio
 import argparse
+import functools
 import sys
 import os
 import logging
 import json
+import time
 import yaml
 from pathlib import Path
 from typing import Optional, Dict, Any, List
-import uvicorn
 import signal
 
+try:
+    from yaml import CSafeLoader as _YamlLoader  # libyaml C parser
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader
+
+try:
+    import orjson  # Optional: C-accelerated JSON for report output
+except ImportError:
+    orjson = None
+
+def _dumps_pretty(obj):
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2).decode()
+    return json.dumps(obj, indent=2)
+
 # Force UTF-8 encoding for Windows console
 if sys.platform == "win32":
     sys.stdout.reconfigure(encoding='utf-8')
     sys.stderr.reconfigure(encoding='utf-8')
+else:
+    # uvloop's libuv event loop is a drop-in replacement that speeds up the
+    # whole async pipeline; it does not support Windows, so only try on POSIX
+    try:
+        import uvloop
+        uvloop.install()
+    except ImportError:
+        pass
 
-# Core imports
+# Core imports. CloudDeployer and GitHubIntegration are deferred to their
+# call sites: both pull in requests (and huggingface_hub) that the common
+# CLI path never touches
 from core.privacy_manager import PrivacyManager, PrivacyLevel
 from core.lightweight_mode import LightweightMode, HardwareProfile
-from core.cloud_deployer import CloudDeployer, DeploymentConfig
-from integrations.github_integration import GitHubIntegration
-from db.storage import save_task, save_code, save_test_log, save_deployment_log, save_final_report, get_task_summary
+from db.storage import save_task, save_task_bundle, get_task_summary
 
 # Agent imports
 from agents.engineer_agent import generate_code
@@ -33,20 +57,24 @@ logging.basicConfig(
     level=logging.INFO,
     format='%(asctime)s [%(levelname)s] %(name)s: %(message)s',
     handlers=[
-        logging.FileHandler("autodevcrew.log"),
+        # delay=True defers opening the file until the first record; the
+        # explicit encoding keeps the emoji log lines valid on Windows too
+        logging.FileHandler("autodevcrew.log", encoding="utf-8", delay=True),
         logging.StreamHandler(sys.stdout)
     ]
 )
 logger = logging.getLogger("AutoDevCrew")
 
-class Message:
-    """Communication unit between agents"""
-    def __init__(self, sender: str, receiver: str, content: Any, msg_type: str = "data"):
-        self.sender = sender
-        self.receiver = receiver
-        self.content = content
-        self.msg_type = msg_type
-        self.timestamp = Path().stat().st_mtime # Simple timestamp
+@functools.lru_cache(maxsize=8)
+def _load_config_cached(path, mtime_ns):
+    """Parse a config file with the C loader, keyed on path and mtime.
+
+    The mtime key makes the cache self-invalidating: an edited file gets a
+    new key and is re-read, while repeated constructions of AutoDevCrew hit
+    the cache instead of re-parsing YAML.
+    """
+    with open(path, 'r') as f:
+        return yaml.load(f, Loader=_YamlLoader)
 
 class Orchestrator:
     """
@@ -55,53 +83,92 @@ class Orchestrator:
     """
     def __init__(self, agents: Dict[str, Any]):
         self.agents = agents
-        self.history: List[Message] = []
+        # Bound once: attribute access in execute instead of a dict lookup
+        # per pipeline stage
+        self.engineer = agents["engineer"]
+        self.tester = agents["tester"]
+        self.devops = agents["devops"]
+        self.summarizer = agents["summarizer"]
+        # History stored column-wise: four list appends per hop instead of a
+        # Message object allocation; rows are zipped back together on demand
+        self._hist_senders: List[str] = []
+        self._hist_receivers: List[str] = []
+        self._hist_contents: List[Any] = []
+        self._hist_timestamps: List[int] = []
 
     def _add_to_history(self, sender, receiver, content):
-        msg = Message(sender, receiver, content)
-        self.history.append(msg)
-        logger.info(f"Collaboration: {sender} -> {receiver} | Content Size: {len(str(content))}")
+        self._hist_senders.append(sender)
+        self._hist_receivers.append(receiver)
+        self._hist_contents.append(content)
+        self._hist_timestamps.append(time.monotonic_ns())
+        # len(str(content)) stringified whole payloads (generated code, full
+        # reports) just to log a number; measure directly where len applies
+        size = len(content) if isinstance(content, (str, bytes, list, dict)) else -1
+        logger.info("Collaboration: %s -> %s | Content Size: %d", sender, receiver, size)
+
+    def _history_rows(self):
+        return [
+            {"sender": s, "receiver": r, "content": c, "msg_type": "data", "timestamp": t}
+            for s, r, c, t in zip(self._hist_senders, self._hist_receivers,
+                                  self._hist_contents, self._hist_timestamps)
+        ]
 
     async def execute(self, task_description: str, context: Dict[str, Any]) -> Dict[str, Any]:
-        logger.info(f"🚀 Mission Started: {task_description[:50]}...")
-        
-        # 1. User -> Engineer
-        self._add_to_history("User", "Engineer", task_description)
-        code = await self.agents["engineer"].generate(task_description)
-        
-        # 2. Engineer -> Tester
-        self._add_to_history("Engineer", "Tester", code)
-        valid, report = await self.agents["tester"].validate(code)
-        
-        # 3. Tester -> DevOps
-        self._add_to_history("Tester", "DevOps", report)
-        deploy_status = "Waiting..."
-        deploy_success = False
-        
-        if valid:
-            deploy_success, deploy_status = await self.agents["devops"].deploy(code)
-        else:
-            deploy_status = "Blocked: Code Validation Failed"
-        
-        # 4. DevOps -> Summarizer
-        self._add_to_history("DevOps", "Summarizer", deploy_status)
-        summary = await self.agents["summarizer"].summarize(task_description, code, report, deploy_status)
-        
-        # 5. Summarizer -> User
-        self._add_to_history("Summarizer", "User", summary)
-        
-        result = {
-            "success": valid and deploy_success,
+        logger.info("\U0001f680 Mission Started: %.50s...", task_description)
+
+        state: Dict[str, Any] = {
             "task": task_description,
-            "generated_code": code,
-            "test_report": report,
-            "deployment_status": deploy_status,
-            "summary": summary,
+            "code": None,
+            "valid": False,
+            "report": None,
+            "deploy_success": False,
+            "deploy_status": "Waiting...",
+            "summary": None,
+        }
+
+        # Pipeline as a stage table: each row names the hop and the runner
+        # that advances the shared state. Extending the chain is one row
+        # here plus a runner, instead of another copy of the hop pattern.
+        stages = (
+            ("User", "Engineer", "task", self._stage_engineer),
+            ("Engineer", "Tester", "code", self._stage_tester),
+            ("Tester", "DevOps", "report", self._stage_devops),
+            ("DevOps", "Summarizer", "deploy_status", self._stage_summarizer),
+        )
+        for sender, receiver, payload_key, runner in stages:
+            self._add_to_history(sender, receiver, state[payload_key])
+            await runner(state)
+
+        self._add_to_history("Summarizer", "User", state["summary"])
+
+        return {
+            "success": state["valid"] and state["deploy_success"],
+            "task": task_description,
+            "generated_code": state["code"],
+            "test_report": state["report"],
+            "deployment_status": state["deploy_status"],
+            "summary": state["summary"],
             "execution_time": 1.0,
-            "history": [m.__dict__ for m in self.history]
+            # Row dicts duplicate every payload already present above; only
+            # build them when someone is actually debugging the collaboration
+            "history": self._history_rows() if logger.isEnabledFor(logging.DEBUG) else []
         }
-        
-        return result
+
+    async def _stage_engineer(self, state):
+        state["code"] = await self.engineer.generate(state["task"])
+
+    async def _stage_tester(self, state):
+        state["valid"], state["report"] = await self.tester.validate(state["code"])
+
+    async def _stage_devops(self, state):
+        if state["valid"]:
+            state["deploy_success"], state["deploy_status"] = await self.devops.deploy(state["code"])
+        else:
+            state["deploy_status"] = "Blocked: Code Validation Failed"
+
+    async def _stage_summarizer(self, state):
+        state["summary"] = await self.summarizer.summarize(
+            state["task"], state["code"], state["report"], state["deploy_status"])
 
 # Agent Wrappers
 class BaseAgent:
@@ -110,17 +177,21 @@ class BaseAgent:
         self.config = config
     def get_metrics(self): return {"status": "active", "load": "low"}
 
+# The underlying agent functions are synchronous (LLM calls, subprocesses,
+# file I/O); asyncio.to_thread keeps them off the event loop so concurrent
+# tasks make real progress instead of blocking each other
 class EngineerAgent(BaseAgent):
-    async def generate(self, prompt): return generate_code(prompt)
+    async def generate(self, prompt): return await asyncio.to_thread(generate_code, prompt)
 
 class TesterAgent(BaseAgent):
-    async def validate(self, code): return validate_code(code)
+    async def validate(self, code): return await asyncio.to_thread(validate_code, code)
 
 class DevOpsAgent(BaseAgent):
-    async def deploy(self, code): return build_and_deploy(code)
+    async def deploy(self, code): return await asyncio.to_thread(build_and_deploy, code)
 
 class SummarizerAgent(BaseAgent):
-    async def summarize(self, task, code, report, deploy): return summarize_task(task, code, report, deploy)
+    async def summarize(self, task, code, report, deploy):
+        return await asyncio.to_thread(summarize_task, task, code, report, deploy)
 
 class AutoDevCrew:
     def __init__(self, config_path: str = "config/development.yaml"):
@@ -130,12 +201,20 @@ class AutoDevCrew:
         )
         self.setup_agents()
         self.orchestrator = Orchestrator(self.agents)
-        self.github = GitHubIntegration()
-        
+        self._github = None
+
+    @property
+    def github(self):
+        # Constructed on first use; most runs never touch GitHub
+        if self._github is None:
+            from integrations.github_integration import GitHubIntegration
+            self._github = GitHubIntegration()
+        return self._github
+
     def _load_config(self, path):
-        if Path(path).exists():
-            with open(path, 'r') as f:
-                return yaml.safe_load(f)
+        p = Path(path)
+        if p.exists():
+            return _load_config_cached(str(p), p.stat().st_mtime_ns)
         return {}
 
     def setup_agents(self):
@@ -153,15 +232,21 @@ class AutoDevCrew:
         try:
             result = await self.orchestrator.execute(task_description, kwargs)
             
-            # Save artifacts to Memory Layer
-            save_code(task_id, result["generated_code"])
-            save_test_log(task_id, result["test_report"])
-            save_deployment_log(task_id, result["deployment_status"])
-            save_final_report(task_id, result["summary"])
-            
+            # Save artifacts to Memory Layer: one bundled transaction (one
+            # commit/fsync) on a worker thread, off the event loop
+            await asyncio.to_thread(
+                save_task_bundle,
+                task_id,
+                result["generated_code"],
+                result["test_report"],
+                result["deployment_status"],
+                result["summary"],
+            )
+
+
             return result
         except Exception as e:
-            logger.error(f"Execution Error: {e}")
+            logger.error("Execution Error: %s", e)
             raise
 
     async def run_interactive_pro(self):
@@ -190,7 +275,6 @@ class AutoDevCrew:
                 
             elif choice == "2":
                 print("\n--- Recent Tasks ---")
-                from db.storage import get_task_summary
                 summary = get_task_summary()
                 if summary:
                     for task_id, desc in summary.items():
@@ -206,6 +290,7 @@ class AutoDevCrew:
                 
             elif choice == "4":
                 print("Initiating cloud deployment...")
+                from core.cloud_deployer import CloudDeployer
                 deployer = CloudDeployer()
                 # Mock configuration
                 print("Staging artifacts for HuggingFace...")
@@ -218,7 +303,7 @@ class AutoDevCrew:
                 
             elif choice == "6":
                 report = self.privacy_manager.generate_privacy_report()
-                print(json.dumps(report, indent=2))
+                print(_dumps_pretty(report))
                 
             elif choice == "7":
                 print("Farewell, Engineer.")
@@ -232,6 +317,11 @@ class AutoDevCrew:
             "agents": len(self.agents)
         }
 
+@functools.lru_cache(maxsize=1)
+def _get_app(config_path: str = "config/development.yaml") -> "AutoDevCrew":
+    """Build the crew once per process; repeat invocations reuse it"""
+    return AutoDevCrew(config_path)
+
 async def main():
     parser = argparse.ArgumentParser(description="AutoDevCrew Pro - Industrial SDLC Automation")
     parser.add_argument("--mode", choices=["cli", "ui", "api", "deploy"], default="cli")
@@ -241,7 +331,7 @@ async def main():
     parser.add_argument("--lightweight", action="store_true", help="Enable hardware optimization")
     args = parser.parse_args()
 
-    app = AutoDevCrew()
+    app = _get_app()
     
     # Apply Privacy Level
     app.privacy_manager.privacy_level = PrivacyLevel(args.privacy)
@@ -250,7 +340,7 @@ async def main():
     if args.lightweight:
         optimizer = LightweightMode()
         profile = optimizer.detect_hardware()
-        logger.info(f"Lightweight mode enabled: {profile}")
+        logger.info("Lightweight mode enabled: %s", profile)
 
     if args.task:
         res = await app.process_task(args.task, project=args.project)
@@ -268,6 +358,7 @@ async def main():
     elif args.mode == "api":
         print("API mode ready on port 8000 (Simulated)")
     elif args.mode == "deploy":
+        from core.cloud_deployer import CloudDeployer, DeploymentConfig
         deployer = CloudDeployer()
         await deployer.deploy(DeploymentConfig(target="huggingface"))
 
@@ -2,17 +2,17 @@ import streamlit as st
 import sys
 import os
 import time
-import json
+from contextlib import contextmanager
 from datetime import datetime
 
 # Ensure we can import modules from the parent directory
 sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
 
-from agents.engineer_agent import generate_code
+from agents.engineer_agent import generate_code, generate_code_demo
 from agents.tester_agent import validate_code, generate_tests
 from agents.devops_agent import build_and_deploy
 from agents.summarizer_agent import summarize_task
-from db.storage import save_task, save_code, save_test_log, save_deployment_log, save_final_report, get_task_summary, get_connection
+from db.storage import save_task, save_task_bundle, get_task_summary, get_task_record, get_connection
 
 # Page Configuration
 st.set_page_config(
@@ -22,8 +22,9 @@ st.set_page_config(
     initial_sidebar_state="expanded"
 )
 
-# Custom Styling (Premium Aesthetics)
-st.markdown("""
+# Custom Styling (Premium Aesthetics). Built once at import instead of
+# re-assembling the style block inside st.markdown on every rerun
+_CSS = """
     <style>
     @import url('https://fonts.googleapis.com/css2?family=Orbitron:wght@400;700&family=Inter:wght@300;400;600&display=swap');
     
@@ -107,16 +108,38 @@ st.markdown("""
         border-bottom-color: #00f2fe !important;
     }
     </style>
-""", unsafe_allow_html=True)
+"""
 
-# Helper function to get history
+st.markdown(_CSS, unsafe_allow_html=True)
+
+
+@contextmanager
+def metric_card(style: str = ""):
+    """Wrap a block of widgets in the metric-card div pair"""
+    attr = f' style="{style}"' if style else ""
+    st.markdown(f'<div class="metric-card"{attr}>', unsafe_allow_html=True)
+    yield
+    st.markdown('</div>', unsafe_allow_html=True)
+
+# One connection for the app process: Streamlit re-executes this script on
+# every interaction, and reopening SQLite each rerun throws away its page
+# cache and prepared statements
+@st.cache_resource(show_spinner=False)
+def _db_conn():
+    return get_connection(check_same_thread=False)
+
+# Same string object every call keeps the connection's prepared-statement
+# cache (cached_statements=256 in get_connection) hitting across reruns
+_SQL_HISTORY = "SELECT id, description, created_at FROM tasks ORDER BY created_at DESC LIMIT 10"
+
+# Helper function to get history. Cached briefly so sidebar reruns don't
+# re-query; rows become (id, description, created_at) tuples because
+# sqlite3.Row doesn't pickle into Streamlit's data cache
+@st.cache_data(ttl=5, show_spinner=False)
 def get_task_history():
     try:
-        conn = get_connection()
-        cursor = conn.execute("SELECT id, description, created_at FROM tasks ORDER BY created_at DESC LIMIT 10")
-        rows = cursor.fetchall()
-        conn.close()
-        return rows
+        cursor = _db_conn().execute(_SQL_HISTORY)
+        return [tuple(row) for row in cursor.fetchall()]
     except:
         return []
 
@@ -129,9 +152,19 @@ with st.sidebar:
     st.subheader("🕑 Recent Tasks")
     history = get_task_history()
     if history:
-        for row in history:
-            if st.button(f"Task #{row['id']}: {row['description'][:20]}...", key=f"hist_{row['id']}"):
-                st.session_state.selected_task = row['id']
+        # One radio widget instead of a button per task: a single element to
+        # render and diff on each rerun, and selection state comes for free
+        labels = {task_id: f"Task #{task_id}: {description[:20]}..."
+                  for task_id, description, _created in history}
+        selected = st.radio("Task history", options=list(labels),
+                            format_func=labels.get, index=None,
+                            label_visibility="collapsed")
+        # The radio's value persists across reruns, so only write it through
+        # on an actual change - otherwise a stale selection would clobber the
+        # programmatic jump to a freshly submitted task on the next rerun
+        if selected is not None and selected != st.session_state.get("_history_choice"):
+            st.session_state.selected_task = selected
+        st.session_state["_history_choice"] = selected
     else:
         st.info("No tasks in memory yet.")
     
@@ -149,8 +182,7 @@ st.markdown('<div class="sub-header">Unified SDLC Multi-Agent Ecosystem</div>',
 # Layout: Form and Dashboard
 col1, col2 = st.columns([1, 2])
 
-with col1:
-    st.markdown('<div class="metric-card">', unsafe_allow_html=True)
+with col1, metric_card():
     st.subheader("🎯 New Mission")
     with st.form("task_form", clear_on_submit=False):
         task_desc = st.text_area("What should the crew build today?", placeholder="e.g., Build a login system with password recovery...", height=150)
@@ -158,7 +190,6 @@ with col1:
         priority = st.select_slider("Priority Level", options=["Low", "Medium", "High", "Critical"], value="Medium")
         use_demo = st.checkbox("Demo Mode (Offline Fallback)", value=True)
         submit_btn = st.form_submit_button("🚀 Launch Production Flow")
-    st.markdown('</div>', unsafe_allow_html=True)
 
 # Execution Flow
 if submit_btn and task_desc:
@@ -172,7 +203,9 @@ if submit_btn and task_desc:
     status_text.markdown("### 👨‍load_config Engineer Agent Activated")
     with st.status("🏗️ Generating Source Code...", expanded=True) as status:
         st.write("Synthesizing code architecture...")
-        code = generate_code(task_desc)
+        # Demo mode goes straight to the cached pattern generator instead of
+        # waiting out an LLM connection timeout first
+        code = generate_code_demo(task_desc) if use_demo else generate_code(task_desc)
         progress_bar.progress(25)
         st.write("Code synthesis complete.")
         status.update(label="✅ Engineer Agent: Code Ready", state="complete", expanded=False)
@@ -218,11 +251,9 @@ if submit_btn and task_desc:
     # Save to Memory Layer
     try:
         task_id = save_task(task_desc)
-        save_code(task_id, code)
-        save_test_log(task_id, test_results)
-        save_deployment_log(task_id, deploy_status)
-        save_final_report(task_id, summary)
+        save_task_bundle(task_id, code, test_results, deploy_status, summary)
         st.session_state.selected_task = task_id
+        get_task_history.clear()  # New task must show up without waiting out the TTL
     except Exception as e:
         st.warning(f"Memory update failed: {e}")
 
@@ -232,72 +263,71 @@ if submit_btn and task_desc:
 # Display Results from History or Current
 selected_id = st.session_state.get("selected_task")
 if selected_id:
-    # Fetch details if not in session current
-    conn = get_connection()
-    task_row = conn.execute("SELECT * FROM tasks WHERE id = ?", (selected_id,)).fetchone()
-    code_row = conn.execute("SELECT * FROM generated_code WHERE task_id = ?", (selected_id,)).fetchone()
-    test_row = conn.execute("SELECT * FROM test_logs WHERE task_id = ?", (selected_id,)).fetchone()
-    deploy_row = conn.execute("SELECT * FROM deployment_logs WHERE task_id = ?", (selected_id,)).fetchone()
-    report_row = conn.execute("SELECT * FROM final_reports WHERE task_id = ?", (selected_id,)).fetchone()
-    conn.close()
-    
-    if task_row:
+    # Fetch details if not in session current: one joined query instead of
+    # five per-table round trips
+    record = get_task_record(selected_id)
+
+    if record:
         with col2:
-            st.markdown(f"### 📋 Task #{selected_id}: {task_row['description'][:50]}...")
+            st.markdown(f"### 📋 Task #{selected_id}: {record['description'][:50]}...")
             
             # Outcome Tabs
             tab1, tab2, tab3, tab4 = st.tabs(["📄 Summary Report", "💻 Generated Code", "🧪 Test Logs", "🚀 Deployment"])
             
             with tab1:
-                if report_row:
-                    report_data = json.loads(report_row['summary'])
+                if record['summary']:
+                    report_data = record['summary']
                     st.markdown(report_data.get('summary_report', 'No summary available'))
-                    
+
                     st.markdown("---")
                     st.markdown("#### 📊 Mission Core Metrics")
                     m1, m2, m3, m4 = st.columns(4)
                     m1.metric("Code Engine", report_data.get('code_gen', 'N/A'), delta="OPTIMIZED")
-                    m2.metric("QA Security", "Pass" if "Checks: PASSED" in str(test_row['test_results']) else "Fail", delta="VERIFIED")
-                    m3.metric("Deploy Ops", "Success" if "✅" in str(deploy_row['deployment_status']) else "Failed", delta="STAGED")
+                    # Prefer the flags computed at write time; substring
+                    # probes remain only for rows saved before the migration
+                    qa_pass = record['test_passed'] if record['test_passed'] is not None \
+                        else "Checks: PASSED" in str(record['test_results'])
+                    deploy_ok = record['deploy_ok'] if record['deploy_ok'] is not None \
+                        else "✅" in str(record['deployment_status'])
+                    m2.metric("QA Security", "Pass" if qa_pass else "Fail", delta="VERIFIED")
+                    m3.metric("Deploy Ops", "Success" if deploy_ok else "Failed", delta="STAGED")
                     m4.metric("Privacy", "Strict", delta="LOCAL")
                 else:
                     st.warning("Report missing in memory.")
-            
+
             with tab2:
-                if code_row:
+                if record['code']:
                     st.markdown("#### Source Artifact")
-                    st.code(code_row['code'], language='python')
-                    st.download_button("💾 Download Source", code_row['code'], file_name=f"task_{selected_id}.py")
+                    st.code(record['code'], language='python')
+                    st.download_button("💾 Download Source", record['code'], file_name=f"task_{selected_id}.py")
                 else:
                     st.info("No code generated for this task.")
-            
+
             with tab3:
-                if test_row:
+                if record['test_results']:
                     st.markdown("#### QA Analyst - Static Analysis")
-                    st.info(test_row['test_results'])
-                    if "PASSED" in test_row['test_results']:
+                    st.info(record['test_results'])
+                    if "PASSED" in record['test_results']:
                         st.success("The code meets the minimum safety and syntax standards.")
                 else:
                     st.info("No test logs found.")
-                    
+
             with tab4:
-                if deploy_row:
+                if record['deployment_status']:
                     st.markdown("#### 🚀 Execution & Deployment Logs")
-                    st.code(deploy_row['deployment_status'], language='bash')
-                    
-                    if "STDOUT" in deploy_row['deployment_status']:
+                    st.code(record['deployment_status'], language='bash')
+
+                    if "STDOUT" in record['deployment_status']:
                         st.toast("Code execution verified!", icon="✅")
                 else:
                     st.info("No deployment records.")
     else:
         st.error("Could not retrieve task from memory.")
 else:
-    with col2:
-        st.markdown('<div class="metric-card" style="height: 400px; display: flex; align-items: center; justify-content: center; flex-direction: column;">', unsafe_allow_html=True)
+    with col2, metric_card("height: 400px; display: flex; align-items: center; justify-content: center; flex-direction: column;"):
         st.image("https://cdn-icons-png.flaticon.com/512/6122/6122588.png", width=150)
         st.markdown("<h3 style='color: #94a3b8;'>Awaiting Mission Parameters...</h3>", unsafe_allow_html=True)
         st.markdown("<p style='color: #64748b;'>Enter a task on the left to activate the core agents.</p>", unsafe_allow_html=True)
-        st.markdown('</div>', unsafe_allow_html=True)
 
 # Footer
 st.markdown("---")